@@ -1,5 +1,6 @@
 import ffmpeg
 from os import remove
+from functools import lru_cache
 from PIL import Image
 import numpy as np
 from scipy.fftpack import dct, idct
@@ -25,6 +26,40 @@ class ColorCoordsConverter:
 
         return r, g, b
 
+    # same coefficients as above written as matrices, so a whole image (H, W, 3)
+    # or a batch of frames (N, H, W, 3) is converted with a single matrix multiply
+    RGB_TO_YUV = np.array([[0.257, 0.504, 0.098],
+                           [-0.148, -0.291, 0.439],
+                           [0.439, -0.368, -0.071]], dtype=np.float32)
+    YUV_TO_RGB = np.array([[1.164, 0.0, 1.596],
+                           [1.164, -0.391, -0.813],
+                           [1.164, 2.018, 0.0]], dtype=np.float32)
+    YUV_OFFSET = np.array([16, 128, 128], dtype=np.float32)
+
+    def rgb_to_yuv_array(rgb): #converts every pixel of an RGB array, last axis must be the 3 channels
+        rgb = ColorCoordsConverter._check_channels(rgb)
+        yuv = rgb.astype(np.float32) @ ColorCoordsConverter.RGB_TO_YUV.T
+        yuv += ColorCoordsConverter.YUV_OFFSET
+        return ColorCoordsConverter._clip_like(yuv, rgb.dtype)
+
+    def yuv_to_rgb_array(yuv): #inverse of rgb_to_yuv_array
+        yuv = ColorCoordsConverter._check_channels(yuv)
+        centered = yuv.astype(np.float32) - ColorCoordsConverter.YUV_OFFSET
+        rgb = centered @ ColorCoordsConverter.YUV_TO_RGB.T
+        return ColorCoordsConverter._clip_like(rgb, yuv.dtype)
+
+    def _check_channels(arr):
+        arr = np.asarray(arr)
+        if arr.shape[-1:] != (3,):
+            raise ValueError("expected an array whose last axis has 3 channels")
+        return arr
+
+    def _clip_like(arr, dtype): #clip to [0, 255], uint8 inputs give uint8 outputs (rounded like the scalar version)
+        np.clip(arr, 0, 255, out=arr)
+        if dtype == np.uint8:
+            return np.rint(arr).astype(np.uint8)
+        return arr
+
 class FFmpeg:
 
     def resize_image(path, new_width, new_height, output_path):
@@ -43,33 +78,47 @@ class FFmpeg:
         ffmpeg.run(stream) 
         print(f"Image resized and saved to: {output_path}")
 
+@lru_cache(maxsize=16) # one table per (width, height), only the most recent sizes are kept
+def serpentine_indices(width, height):
+    # flat indices (y * width + x) of every pixel in serpentine order, same walk as the
+    # original loop: even diagonals go bottom-left → top-right, odd ones top-right → bottom-left
+    dtype = np.int32 if width * height < 2**31 else np.int64
+    d = np.arange(width + height - 1)
+    x_min = np.maximum(0, d - height + 1)
+    x_max = np.minimum(d, width - 1)
+    # position in the scan where each diagonal starts
+    starts = np.concatenate(([0], np.cumsum(x_max - x_min + 1)[:-1])).astype(dtype)
+
+    y, x = np.indices((height, width), dtype=dtype)
+    diagonal = x + y
+    rank = np.where(diagonal % 2 == 0, x - x_min[diagonal], x_max[diagonal] - x)
+
+    order = np.empty(width * height, dtype=dtype)
+    order[(starts[diagonal] + rank).ravel()] = np.arange(width * height, dtype=dtype)
+    order.flags.writeable = False # shared by every caller through the cache
+    return order
+
+def serpentine_array(arr, offset=0, limit=None):
+    # gathers the pixels of an (H, W) or (H, W, C) array in serpentine order, only the
+    # [offset, offset + limit) part of the scan is read
+    arr = np.asarray(arr)
+    height, width = arr.shape[:2]
+    idx = serpentine_indices(width, height)
+    stop = None if limit is None else offset + limit
+    flat = arr.reshape(height * width, *arr.shape[2:])
+    return np.ascontiguousarray(flat[idx[offset:stop]])
+
+def inverse_serpentine(values, width, height):
+    # puts a serpentine scan back into an (H, W) or (H, W, C) array
+    values = np.asarray(values)
+    out = np.empty((height * width, *values.shape[1:]), dtype=values.dtype)
+    out[serpentine_indices(width, height)] = values
+    return out.reshape(height, width, *values.shape[1:])
+
 def serpentine(file):
     img = Image.open(file).convert("RGB")
-    width, height = img.size
-    pixels = img.load()
-    serp = []
-
-    for diagonal in range(width + height - 1):
-        # even diagonals: go top-left → bottom-right along diagonal
-        if diagonal % 2 == 0:
-            x_start = max(0, diagonal - height + 1)
-            y_start = min(diagonal, height - 1)
-            x, y = x_start, y_start
-            while x < width and y >= 0:
-                serp.append(pixels[x, y])
-                x += 1
-                y -= 1
-        # odd diagonals: go bottom-right → top-left along diagonal
-        else:
-            y_start = max(0, diagonal - width + 1)
-            x_start = min(diagonal, width - 1)
-            x, y = x_start, y_start
-            while x >= 0 and y < height:
-                serp.append(pixels[x, y])
-                x -= 1
-                y += 1
-
-    return serp
+    serp = serpentine_array(np.asarray(img))
+    return [tuple(p) for p in serp.tolist()]
 
 
 def compress_to_grayscale(input_path, output_path):
@@ -88,24 +137,99 @@ def compress_to_grayscale(input_path, output_path):
         print(f"Grayscale compressed image saved to: {output_path}")
 
 # following the example from class, we apply RLE to compress zero runs only
+# a zero run becomes the pair [0, count], non-zero values are stored normally (not compressed)
+
+def _as_array(data): # bytes, bytearray and memoryview are read as uint8 without copying
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.uint8)
+    return np.asarray(data).ravel()
+
+def _rle_dtype(arr, max_run):
+    if max_run is None:
+        return np.int64
+    return np.result_type(arr.dtype, np.min_scalar_type(max_run))
+
+def _zero_run_tokens(count, max_run, dtype): # [0, count] pairs for a single run, split every max_run zeros
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    if max_run is None or count <= max_run:
+        return np.array([0, count], dtype=dtype)
+    full, rest = divmod(count, max_run)
+    counts = [max_run] * full + ([rest] if rest else [])
+    tokens = np.zeros(2 * len(counts), dtype=dtype)
+    tokens[1::2] = counts
+    return tokens
+
+def run_length_encoding_zeros_array(data, max_run=None):
+    # vectorized version: run boundaries come from np.diff, no python loop over the values
+    # with max_run (e.g. 255 for bytes) long runs are split so every count fits the output type
+    arr = _as_array(data)
+    dtype = _rle_dtype(arr, max_run)
+    is_zero = np.concatenate(([False], arr == 0, [False])).view(np.int8)
+    edges = np.diff(is_zero)
+    run_starts = np.flatnonzero(edges == 1)
+    run_lengths = np.flatnonzero(edges == -1) - run_starts
+    if run_starts.size == 0:
+        return arr.astype(dtype)
+
+    # how many [0, count] pairs each run needs
+    pieces = np.ones_like(run_lengths) if max_run is None else -(-run_lengths // max_run)
+
+    # keep the non-zero values and one zero per pair, drop the rest of each run
+    repeats = (arr != 0).astype(np.int64)
+    repeats[run_starts] = pieces
+    kept = np.repeat(arr, repeats).astype(dtype)
+
+    counts = run_lengths.copy() if max_run is None else np.full(pieces.sum(), max_run, dtype=np.int64)
+    if max_run is not None:
+        counts[np.cumsum(pieces) - 1] = run_lengths - (pieces - 1) * max_run
+
+    return np.insert(kept, np.flatnonzero(kept == 0) + 1, counts.astype(dtype))
 
 def run_length_encoding_zeros(byte_list):
-    encoded = []
-    i = 0
-    while i < len(byte_list):
-        if byte_list[i] == 0: # we found a zero, we count the run length
-            count = 1
-            i += 1
-            while i < len(byte_list) and byte_list[i] == 0:
-                count += 1
-                i += 1
-
-            encoded.extend([0, count]) # we store the zero and its count
-        else:
-            encoded.append(byte_list[i]) # non-zero byte, we store it normally (not compressed)
-            i += 1
-
-    return encoded
+    return run_length_encoding_zeros_array(byte_list).tolist()
+
+def run_length_decoding_zeros(encoded):
+    # every 0 in the encoded data starts a pair (counts are never 0), the value after it is the run length
+    enc = _as_array(encoded)
+    markers = np.flatnonzero(enc == 0)
+    if markers.size and markers[-1] == enc.size - 1:
+        raise ValueError("encoded data ends with a zero that has no run length")
+
+    repeats = np.ones(enc.size, dtype=np.int64)
+    repeats[markers] = enc[markers + 1]
+    repeats[markers + 1] = 0
+    return np.repeat(enc, repeats)
+
+class ZeroRunEncoder: # incremental encoder, a zero run that reaches the end of a chunk stays open for the next one
+
+    def __init__(self, max_run=None):
+        self.max_run = max_run
+        self.pending_zeros = 0
+        self.dtype = None
+
+    def feed(self, chunk):
+        arr = _as_array(chunk)
+        if self.dtype is None:
+            self.dtype = _rle_dtype(arr, self.max_run)
+
+        nonzero = np.flatnonzero(arr)
+        if nonzero.size == 0:
+            self.pending_zeros += arr.size
+            return np.empty(0, dtype=self.dtype)
+
+        first, last = nonzero[0], nonzero[-1]
+        out = np.concatenate((
+            _zero_run_tokens(self.pending_zeros + int(first), self.max_run, self.dtype),
+            run_length_encoding_zeros_array(arr[first:last + 1], self.max_run).astype(self.dtype),
+        ))
+        self.pending_zeros = arr.size - int(last) - 1
+        return out
+
+    def flush(self): # closes the last zero run
+        out = _zero_run_tokens(self.pending_zeros, self.max_run, self.dtype or np.int64)
+        self.pending_zeros = 0
+        return out
 
 class DCTTools: # apply 2D DCT and IDCT to 8x8 blocks of an image (simplified version of what JPEG does)
 
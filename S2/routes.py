@@ -1,4 +1,4 @@
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, UploadFile, File, Request
 from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
 import requests
 import tempfile
@@ -12,8 +12,10 @@ from first_seminar import (
     ColorCoordsConverter,
     FFmpeg,
     serpentine,
+    serpentine_array,
     compress_to_grayscale,
     run_length_encoding_zeros,
+    ZeroRunEncoder,
     DCTTools,
     DWTTools
 )
@@ -162,6 +164,30 @@ def yuv_to_rgb(y: float, u: float, v: float):
     r, g, b = ColorCoordsConverter.yuv_to_rgb(y, u, v)
     return {"r": r, "g": g, "b": b}
 
+def png_response(arr, filename):
+    buf = BytesIO()
+    Image.fromarray(arr).save(buf, format="PNG")
+    buf.seek(0)
+    return StreamingResponse(
+        buf,
+        media_type="image/png",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+@router.post("/rgb-to-yuv-image")
+async def rgb_to_yuv_image(file: UploadFile = File(...)):
+    # whole image at once, the Y, U and V planes are stored in the 3 channels of the PNG
+    img = Image.open(BytesIO(await file.read())).convert("RGB")
+    yuv = ColorCoordsConverter.rgb_to_yuv_array(np.asarray(img))
+    return png_response(yuv, "image_yuv.png")
+
+@router.post("/yuv-to-rgb-image")
+async def yuv_to_rgb_image(file: UploadFile = File(...)):
+    # expects a 3 channel image holding the Y, U and V planes (like the output of /rgb-to-yuv-image)
+    img = Image.open(BytesIO(await file.read())).convert("RGB")
+    rgb = ColorCoordsConverter.yuv_to_rgb_array(np.asarray(img))
+    return png_response(rgb, "image_rgb.png")
+
 @router.post("/resize-image")
 async def resize_image(file: UploadFile = File(...), width: int = 320, height: int = 240):
 
@@ -176,13 +202,19 @@ async def resize_image(file: UploadFile = File(...), width: int = 320, height: i
     return response.json()
 
 @router.post("/serpentine")
-async def serpentine_endpoint(file: UploadFile = File(...)):
-    src = tempfile.NamedTemporaryFile(delete=False)
-    src.write(await file.read())
-    src.close()
+async def serpentine_endpoint(file: UploadFile = File(...), offset: int = 0, limit: int = 50):
+    if offset < 0 or limit < 0:
+        return JSONResponse({"error": "offset and limit must be non-negative"}, status_code=400)
+
+    img = Image.open(BytesIO(await file.read())).convert("RGB")
 
-    serp = serpentine(src.name)
-    return {"serpentine_pixels": serp[:50]}   # return only first 50 for readability
+    # only the requested slice of the scan is gathered (first 50 by default for readability)
+    serp = serpentine_array(np.asarray(img), offset=offset, limit=limit)
+    return {
+        "total_pixels": img.width * img.height,
+        "offset": offset,
+        "serpentine_pixels": serp.tolist(),
+    }
 
 
 @router.post("/compress-grayscale")
@@ -198,8 +230,28 @@ async def grayscale_compress(file: UploadFile = File(...)):
     return response.json()
 
 
-@router.post("/rle")
-def rle_zero_runs(data: list[int]):
+@router.post("/rle", openapi_extra={"requestBody": {"content": {
+    "application/json": {"schema": {"type": "array", "items": {"type": "integer"}}},
+    "application/octet-stream": {"schema": {"type": "string", "format": "binary"}},
+}}})
+async def rle_zero_runs(request: Request):
+    if request.headers.get("content-type", "").startswith("application/octet-stream"):
+        # raw bytes are encoded chunk by chunk as they arrive, runs longer than 255 are split
+        # so the output is also one byte per value
+        encoder = ZeroRunEncoder(max_run=255)
+
+        async def encoded_chunks():
+            async for chunk in request.stream():
+                out = encoder.feed(chunk)
+                if out.size:
+                    yield out.astype(np.uint8).tobytes()
+            yield encoder.flush().astype(np.uint8).tobytes()
+
+        return StreamingResponse(encoded_chunks(), media_type="application/octet-stream")
+
+    data = await request.json()
+    if not isinstance(data, list) or not all(isinstance(x, int) for x in data):
+        return JSONResponse({"error": "Expected a JSON list of integers."}, status_code=422)
     encoded = run_length_encoding_zeros(data)
     return {"encoded": encoded}
 
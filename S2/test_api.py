@@ -1,4 +1,7 @@
 import unittest
+from io import BytesIO
+import numpy as np
+from PIL import Image
 from fastapi.testclient import TestClient
 from practice1 import app
 
@@ -17,4 +20,35 @@ class TestAPI(unittest.TestCase):
         assert r.status_code == 200
         assert "r" in r.json()
 
-    
\ No newline at end of file
+    def test_rgb_to_yuv_image(self):
+        buf = BytesIO()
+        Image.new("RGB", (16, 8), (100, 150, 200)).save(buf, format="PNG")
+        r = client.post("/rgb-to-yuv-image", files={"file": ("img.png", buf.getvalue(), "image/png")})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "image/png"
+
+        yuv = np.asarray(Image.open(BytesIO(r.content)))
+        assert yuv.shape == (8, 16, 3)
+        r2 = client.post("/yuv-to-rgb-image", files={"file": ("yuv.png", r.content, "image/png")})
+        rgb = np.asarray(Image.open(BytesIO(r2.content)))
+        assert np.all(np.abs(rgb[0, 0].astype(int) - [100, 150, 200]) <= 2)
+
+    def test_serpentine_offset_limit(self):
+        buf = BytesIO()
+        Image.new("RGB", (10, 10), (1, 2, 3)).save(buf, format="PNG")
+        r = client.post("/serpentine?offset=95&limit=10", files={"file": ("img.png", buf.getvalue(), "image/png")})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["total_pixels"] == 100
+        assert data["serpentine_pixels"] == [[1, 2, 3]] * 5
+
+    def test_rle_json(self):
+        r = client.post("/rle", json=[5, 0, 0, 0, 7])
+        assert r.status_code == 200
+        assert r.json() == {"encoded": [5, 0, 3, 7]}
+
+    def test_rle_octet_stream(self):
+        r = client.post("/rle", content=bytes([1, 0, 0, 2, 0]),
+                        headers={"content-type": "application/octet-stream"})
+        assert r.status_code == 200
+        assert r.content == bytes([1, 0, 2, 2, 0, 1])
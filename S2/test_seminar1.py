@@ -8,8 +8,14 @@ from first_seminar import (
     ColorCoordsConverter,
     FFmpeg,
     serpentine,
+    serpentine_indices,
+    serpentine_array,
+    inverse_serpentine,
     compress_to_grayscale,
     run_length_encoding_zeros,
+    run_length_encoding_zeros_array,
+    run_length_decoding_zeros,
+    ZeroRunEncoder,
     DCTTools,
     DWTTools
 )
@@ -26,6 +32,30 @@ class TestColorCoordsConverter(unittest.TestCase):
         self.assertAlmostEqual(g, g2, delta=1)
         self.assertAlmostEqual(b, b2, delta=1)
 
+    def test_array_matches_scalar(self):
+        rgb = np.random.randint(0, 256, (4, 5, 3)).astype(np.uint8)
+        yuv = ColorCoordsConverter.rgb_to_yuv_array(rgb.astype(float))
+
+        r, g, b = (int(c) for c in rgb[2, 3])
+        expected = ColorCoordsConverter.rgb_to_yuv(r, g, b)
+        self.assertTrue(np.allclose(yuv[2, 3], expected, atol=1e-3))
+
+        back = ColorCoordsConverter.yuv_to_rgb_array(yuv)
+        self.assertTrue(np.allclose(back, rgb, atol=1))
+
+    def test_array_batch_of_frames(self):
+        frames = np.random.randint(0, 256, (2, 4, 6, 3)).astype(np.uint8)
+        yuv = ColorCoordsConverter.rgb_to_yuv_array(frames)
+
+        self.assertEqual(yuv.shape, frames.shape)
+        self.assertEqual(yuv.dtype, np.uint8)
+        back = ColorCoordsConverter.yuv_to_rgb_array(yuv)
+        self.assertTrue(np.all(np.abs(back.astype(int) - frames.astype(int)) <= 2))
+
+    def test_array_needs_three_channels(self):
+        with self.assertRaises(ValueError):
+            ColorCoordsConverter.rgb_to_yuv_array(np.zeros((4, 4)))
+
 
 class TestFFmpeg(unittest.TestCase):
 
@@ -77,6 +107,19 @@ class TestSerpentine(unittest.TestCase):
             if os.path.exists(temp_file):
                 os.remove(temp_file)
 
+    def test_serpentine_indices_non_square(self):
+        # 3 wide, 2 high: (0,0) (1,0) (0,1) (1,1) (2,0) (2,1) as (x, y)
+        idx = serpentine_indices(3, 2)
+        self.assertEqual(idx.tolist(), [0, 1, 3, 4, 2, 5])
+
+    def test_serpentine_array_slice_and_inverse(self):
+        arr = np.random.randint(0, 255, (5, 7, 3)).astype(np.uint8)
+
+        full = serpentine_array(arr)
+        self.assertEqual(full.shape, (35, 3))
+        self.assertTrue(np.array_equal(serpentine_array(arr, offset=4, limit=6), full[4:10]))
+        self.assertTrue(np.array_equal(inverse_serpentine(full, 7, 5), arr))
+
 class TestRunLengthEncoding(unittest.TestCase):
 
     def test_rle_zero_runs(self):
@@ -85,6 +128,23 @@ class TestRunLengthEncoding(unittest.TestCase):
         expected = [5, 0, 3, 7, 0, 1, 8]
         self.assertEqual(encoded, expected)
 
+    def test_rle_decode_roundtrip(self):
+        data = np.array([0, 0, 5, 0, 0, 0, 7, 0, 8, 0], dtype=np.uint8)
+        encoded = run_length_encoding_zeros_array(data)
+        self.assertTrue(np.array_equal(run_length_decoding_zeros(encoded), data))
+
+    def test_rle_bytes_long_run_split(self):
+        data = bytes([0] * 300 + [9])
+        encoded = run_length_encoding_zeros_array(data, max_run=255)
+        self.assertEqual(encoded.dtype, np.uint8)
+        self.assertEqual(encoded.tolist(), [0, 255, 0, 45, 9])
+        self.assertEqual(run_length_decoding_zeros(encoded.tobytes()).tobytes(), data)
+
+    def test_rle_incremental_run_across_chunks(self):
+        encoder = ZeroRunEncoder()
+        parts = [encoder.feed([4, 0, 0]), encoder.feed([0, 0]), encoder.feed([0, 6, 0]), encoder.flush()]
+        self.assertEqual(np.concatenate(parts).tolist(), [4, 0, 5, 6, 0, 1])
+
 
 class TestDCT(unittest.TestCase):
 